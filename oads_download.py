@@ -19,9 +19,12 @@ Juper notebook provided to the author by ESA."""
 
 import argparse
 import datetime
+import math
 import os
 import re
+import shutil
 import sys
+import threading
 import time
 from argparse import RawTextHelpFormatter
 
@@ -30,21 +33,30 @@ try:
 except ModuleNotFoundError:
     import tomli as tomllib  # type: ignore
 
-import json
+try:
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    from json import loads as json_loads
+
 import logging
 import urllib.parse as urlp
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from itertools import islice
+from functools import lru_cache
+from itertools import chain, islice
 from logging import Logger
-from typing import Final, TypeAlias
+from typing import TYPE_CHECKING, BinaryIO, Final, Iterable, Iterator, TypeAlias
 from zipfile import BadZipFile, ZipFile
 
-import numpy as np
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+import urllib3
 from lxml import html
-from pandas._libs.tslibs.parsing import DateParseError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    # pandas is imported where it is needed to keep the CLI startup fast (e.g. for -h)
+    import pandas as pd
 
 # Custom types
 Orbit: TypeAlias = int
@@ -54,20 +66,29 @@ DictJSON: TypeAlias = dict
 
 # Constants
 # General script behaviour (can be edited here as required):
-CHUNK_SIZE_BYTES: Final[int] = 256 * 1024  # Represents 256 KB
+CHUNK_SIZE_BYTES: Final[int] = 1024 * 1024  # Represents 1 MB
+PROGRESS_BAR_UPDATE_INTERVAL_SECONDS: Final[float] = (
+    0.25  # Minimum time between updates of the download progress bar
+)
 MAX_NUM_ORBITS_PER_REQUEST: Final[int] = (
     50  # Large request are split accoring to this chunk size
 )
 MAX_NUM_RESULTS_PER_REQUEST: Final[int] = (
     2000  # Since large requests are split into chunks, this should be more than enouth
 )
+MAX_NUM_PARALLEL_SEARCH_REQUESTS: Final[int] = (
+    8  # Maximum number of search requests send to EO-CAT at the same time
+)
 MAX_NUM_LOGS: Final[int | None] = 10  # Set to None for no limit
-MAX_AGE_LOGS: Final[pd.Timedelta | None] = (
-    None  # Time period, e.g. pd.Timedelta(weeks=4)
+MAX_AGE_LOGS: Final[datetime.timedelta | None] = (
+    None  # Time period, e.g. datetime.timedelta(weeks=4)
 )
 MAX_DOWNLOAD_ATTEMPTS_PER_FILE: Final[int] = (
     3  # Maximum number of times a download request is repeated on error
 )
+MAX_NUM_PARALLEL_DOWNLOADS: Final[int] = (
+    4  # Files downloaded at the same time per server (progress bars are only shown if set to 1)
+)
 # Level subfolder names (can be edited here as required):
 SUBDIR_NAME_AUX_FILES: Final[str] = "Meteo_Supporting_Files"
 SUBDIR_NAME_ORB_FILES: Final[str] = "Orbit_Data_Files"
@@ -79,6 +100,9 @@ SUBDIR_NAME_L2B_FILES: Final[str] = "L2b"
 # Don't change these:
 FRAMES: Final[str] = "ABCDEFGH"
 NUM_FRAMES: Final[int] = 8
+FRAMES_TUPLE: Final[tuple[str, ...]] = tuple(FRAMES)
+FRAMES_SET: Final[frozenset[str]] = frozenset(FRAMES)
+_FRAME_INDICES: Final[dict[str, int]] = {f: i for i, f in enumerate(FRAMES)}
 PROGRAM_NAME: Final[str] = "oads_download"
 SETUP_INSTRUCTIONS = """!!! Note: A configuration file containing your OADS credentials is required.
 !!! If you don't have one yet, simply create a file called 'config.toml'
@@ -118,6 +142,10 @@ class BadResponseError(Exception):
     pass
 
 
+class DownloadCancelledError(Exception):
+    pass
+
+
 @dataclass
 class SearchRequest:
     """This class contains all data required as input for the URL template of the OpenSearch API request to EO-CAT."""
@@ -135,30 +163,30 @@ class SearchRequest:
     frame_id: str | None = None
 
     def low_detail_summary(self):
-        msg = f"{self.product_type}"
+        parts: list[str] = [f"{self.product_type}"]
         if self.product_version:
-            msg = f"{msg}:{self.product_version}"
+            parts[0] = f"{parts[0]}:{self.product_version}"
         if self.start_time and self.end_time:
             if self.start_time == self.end_time:
-                msg = f"{msg}, time={self.start_time}"
+                parts.append(f"time={self.start_time}")
             else:
-                msg = f"{msg}, time={self.start_time}/{self.end_time}"
+                parts.append(f"time={self.start_time}/{self.end_time}")
         if self.radius and self.lat and self.lon:
-            msg = f"{msg}, radius=({self.radius}m, {self.lat}N, {self.lon}E)"
+            parts.append(f"radius=({self.radius}m, {self.lat}N, {self.lon}E)")
         if self.bbox:
-            msg = f"{msg}, bbox={self.bbox}"
+            parts.append(f"bbox={self.bbox}")
         if self.frame_id:
-            msg = f"{msg}, frame={self.frame_id}"
+            parts.append(f"frame={self.frame_id}")
         if self.orbit_number:
-            o_msg = f"{self.orbit_number}"
-            if len(o_msg.split(",")) > 6:
-                o_msg = (
-                    ",".join(o_msg.split(",")[0:2])
-                    + f",... {len(o_msg.split(',')) - 4} more orbits ...,"
-                    + ",".join(o_msg.split(",")[-2:])
-                )
-            msg = f"{msg}, orbits={o_msg.replace(',', ', ')}"
-        return msg
+            orbits = f"{self.orbit_number}".split(",")
+            if len(orbits) > 6:
+                orbits = [
+                    *orbits[0:2],
+                    f"... {len(orbits) - 4} more orbits ...",
+                    *orbits[-2:],
+                ]
+            parts.append(f"orbits={', '.join(orbits)}")
+        return ", ".join(parts)
 
 
 def log_heading(
@@ -173,8 +201,8 @@ def log_heading(
 
     if is_mayor:
         half_padding = (line_length - len(text)) / 2
-        padding_left = int(np.floor(half_padding))
-        padding_right = int(np.ceil(half_padding))
+        padding_left = math.floor(half_padding)
+        padding_right = math.ceil(half_padding)
     else:
         padding_left = 1
         padding_right = line_length - len(text) - 1
@@ -186,13 +214,13 @@ def log_heading(
 
 # --- Set up logging --------------------------------------
 def remove_old_logs(
-    max_num_logs: int | None = None, max_age_logs: pd.Timedelta | None = None
+    max_num_logs: int | None = None, max_age_logs: datetime.timedelta | None = None
 ) -> None:
     """Deletes old log files depending on given maximum file number and/or age"""
     logs_dirpath = os.path.abspath("logs")
 
     if os.path.exists(logs_dirpath):
-        pattern = r".*oads_download_[0-9]{8}T[0-9]{6}(|_[0-9]*).log"
+        pattern = r".*oads_download_([0-9]{8}T[0-9]{6})(|_[0-9]*).log"
         if max_num_logs:
             old_logs = [
                 os.path.abspath(os.path.join(logs_dirpath, fp))
@@ -205,21 +233,14 @@ def remove_old_logs(
                     os.remove(log)
 
         if max_age_logs:
-            current_time = pd.Timestamp(
-                time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(time.time()))
-            )
-            last_allowed_time = current_time - max_age_logs
-            old_logs = [
-                os.path.abspath(os.path.join(logs_dirpath, fp))
-                for fp in os.listdir(logs_dirpath)
-                if re.search(pattern, fp)
-            ]
-            for log in old_logs:
-                log_time = pd.Timestamp(
-                    os.path.basename(log).split(".")[0].split("_")[-1]
-                )
+            last_allowed_time = datetime.datetime.now() - max_age_logs
+            for fp in os.listdir(logs_dirpath):
+                match = re.search(pattern, fp)
+                if match is None:
+                    continue
+                log_time = datetime.datetime.strptime(match.group(1), "%Y%m%dT%H%M%S")
                 if log_time < last_allowed_time:
-                    os.remove(log)
+                    os.remove(os.path.abspath(os.path.join(logs_dirpath, fp)))
 
 
 def console_exclusive_info(*values: object, end: str | None = "\n") -> None:
@@ -253,7 +274,7 @@ def create_logger(log_to_file: bool, debug: bool = False) -> Logger:
     if log_to_file:
         ensure_directory("logs")
 
-        log_filename = f"logs/oads_download_{time.strftime('%Y%m%dT%H%M%S', time.localtime(time.time()))}.log"
+        log_filename = f"logs/oads_download_{datetime.datetime.now():%Y%m%dT%H%M%S}.log"
         # Ensure that a new log is created instead of appending to an existing log
         new_log_filename = log_filename
         i = 2
@@ -283,11 +304,16 @@ def ensure_directory(dirpath: str) -> None:
 # ---------------------------------------------------------
 
 
-def get_request(url: str, logger: Logger | None = None, **kwargs) -> requests.Response:
-    """Sends a GET request, validates it's response and returns it."""
+def get_request(
+    url: str,
+    session: requests.Session | None = None,
+    logger: Logger | None = None,
+    **kwargs,
+) -> requests.Response:
+    """Sends a GET request (using the connection pool of the session if given), validates it's response and returns it."""
     if logger:
         logger.debug(f"Send GET request: {url}")
-    response = requests.get(url, **kwargs)
+    response = (session or requests).get(url, **kwargs)
     validate_request_response(response)
     return response
 
@@ -314,18 +340,39 @@ def get_url_of_items(data: DictJSON) -> str:
     return matching_hrefs[0]
 
 
-def get_url_of_collection_items(
-    collection_identifier: str,
-    logger: Logger | None = None,
-) -> str:
-    """Finds items url of given collection."""
+# Caches the EarthCARE collections found in EO-CAT (key: entrypoint URL)
+_earthcare_collections_cache: dict[str, list[DictJSON]] = {}
+_earthcare_collections_lock = threading.Lock()
+
+
+def get_earthcare_collections(
+    session: requests.Session | None = None, logger: Logger | None = None
+) -> list[DictJSON]:
+    """Returns all EarthCARE collections (EO-CAT is requested only once per run)."""
     url_entrypoint = "https://eocat.esa.int/collections"
+    # Concurrent search requests wait here until the collections are available
+    with _earthcare_collections_lock:
+        if url_entrypoint not in _earthcare_collections_cache:
+            _earthcare_collections_cache[url_entrypoint] = (
+                _request_earthcare_collections(
+                    url_entrypoint, session=session, logger=logger
+                )
+            )
+    return _earthcare_collections_cache[url_entrypoint]
+
+
+def _request_earthcare_collections(
+    url_entrypoint: str,
+    session: requests.Session | None = None,
+    logger: Logger | None = None,
+) -> list[DictJSON]:
+    """Requests all EarthCARE collections from EO-CAT."""
     if logger:
         logger.debug(f"Entrypoint: {url_entrypoint}")
 
-    response = get_request(url_entrypoint, logger=logger)
+    response = get_request(url_entrypoint, session=session, logger=logger)
 
-    data = json.loads(response.text)
+    data = json_loads(response.content)
     url_collections_queryables = get_url_of_queryables(data)
     if logger:
         logger.debug(f"Collections queryables: {url_collections_queryables}")
@@ -338,18 +385,24 @@ def get_url_of_collection_items(
     url_earthcare_collections = f"{url_entrypoint}?&title=earthcare&limit=100"
     if logger:
         logger.debug(f"Search for EarthCARE collections: {url_earthcare_collections}")
-    response = get_request(url_earthcare_collections, logger=logger)
+    response = get_request(url_earthcare_collections, session=session, logger=logger)
     # if logger: logger.debug(response)
 
-    data_collections = json.loads(response.text)
+    data_collections = json_loads(response.content)
     available_earthcare_collections = [d["id"] for d in data_collections["collections"]]
     if logger:
         logger.debug(
             f"Available EarthCARE collections: {available_earthcare_collections}"
         )
 
+    return data_collections["collections"]
+
+
+@lru_cache(maxsize=None)  # Bounded by the number of EarthCARE collections
+def _get_url_of_collection_items(collection_identifier: str) -> str:
+    """Finds items url of given collection in the cached EarthCARE collections."""
     data_collection = [
-        d for d in data_collections["collections"] if d["id"] == collection_identifier
+        d for d in get_earthcare_collections() if d["id"] == collection_identifier
     ][0]
     # url_collection_queryables = get_url_of_queryables(data_collection)
     # if logger: logger.debug(url_collection_queryables)
@@ -360,7 +413,22 @@ def get_url_of_collection_items(
     # if logger: logger.debug(list(data_collection_queryables['properties'].keys()))
 
     url_collection_items = get_url_of_items(data_collection)
-    # if logger: logger.debug(url_collection_items)
+
+    return url_collection_items
+
+
+def get_url_of_collection_items(
+    collection_identifier: str,
+    session: requests.Session | None = None,
+    logger: Logger | None = None,
+) -> str:
+    """Finds items url of given collection."""
+    get_earthcare_collections(session=session, logger=logger)
+    url_collection_items = _get_url_of_collection_items(collection_identifier)
+    if logger:
+        logger.debug(
+            f"Items of collection '{collection_identifier}': {url_collection_items}"
+        )
 
     return url_collection_items
 
@@ -425,7 +493,7 @@ def get_validated_frame_id(frame_id: str, logger: Logger | None = None) -> str:
         if len(frame_id) != 1:
             exception_msg = f"Got an empty string as frame ID. Valid frames are single letters from A to H."
             raise InvalidInputError(exception_msg)
-        if frame_id not in "ABCDEFGH":
+        if frame_id not in FRAMES_SET:
             exception_msg = f"{frame_id} is not a valid frame ID. Valid frames are single letters from A to H."
             raise InvalidInputError(exception_msg)
     except InvalidInputError as e:
@@ -439,15 +507,17 @@ def get_validated_orbit_and_frame(
     orbit_and_frame: OrbitAndFrame, logger: Logger | None = None
 ) -> tuple[Orbit, Frame]:
     """Extracts validated orbit number and frame ID from string and raises InvalidInputError if string does not describe a orbit and frame"""
-    try:
-        orbit_number = get_validated_orbit_number(int(orbit_and_frame[0:-1]))
-        frame_id = get_validated_frame_id(orbit_and_frame[-1])
-    except Exception as e:
+    if (
+        len(orbit_and_frame) < 2
+        or len(orbit_and_frame) > 6
+        or not orbit_and_frame[0:-1].isdecimal()
+        or orbit_and_frame[-1].upper() not in FRAMES_SET
+    ):
         exception_msg = f"{orbit_and_frame} is not a valid orbit and frame name. Valid names contain the orbit number followed by the frame id letter (e.g. 3000B or 03000B)."
         if logger:
             logger.exception(exception_msg)
-        raise
-    return orbit_number, frame_id
+        raise InvalidInputError(exception_msg)
+    return int(orbit_and_frame[0:-1]), orbit_and_frame[-1].upper()
 
 
 def get_validated_selected_index(
@@ -493,7 +563,7 @@ def get_validated_orbit_number_range(
                 )
             start_orbit_number = get_validated_orbit_number(start_orbit_number)
             end_orbit_number = get_validated_orbit_number(end_orbit_number)
-            return np.arange(start_orbit_number, end_orbit_number + 1).tolist()
+            return list(range(start_orbit_number, end_orbit_number + 1))
     except InvalidInputError as e:
         if logger:
             logger.exception(e)
@@ -521,6 +591,8 @@ def get_complete_and_incomplete_orbits(
     if len(orbit_and_frames) == 0:
         return None, None
 
+    import pandas as pd
+
     orbit_numbers: list[Orbit] = [oaf[0] for oaf in orbit_and_frames]
     frame_ids: list[Frame] = [oaf[1] for oaf in orbit_and_frames]
 
@@ -569,6 +641,49 @@ def get_counter_message(
     return count_msg, max_count_digits
 
 
+def get_progress_bar_message(
+    count_msg: str,
+    current_length: int,
+    total_length: int,
+    elapsed_time: float,
+    progress_bar_length: int = 30,
+) -> str:
+    """Creates a download progress bar showing percentage, time left, speed and size (e.g. like this [ 7/10]  50% [###---] 00:00:02 - 5.00 MB/s - 10.00/20.00 MB)."""
+    fraction_done = current_length / total_length if total_length > 0 else 1.0
+    done = int(progress_bar_length * fraction_done)
+    if fraction_done > 0:
+        time_estimated = elapsed_time / fraction_done
+        time_left = time.strftime(
+            "%H:%M:%S", time.gmtime(max(0, int(time_estimated - elapsed_time)))
+        )
+    else:
+        # No estimate before the first bytes arrived
+        time_left = "--:--:--"
+    progress_bar = f"[{'#' * done}{'-' * (progress_bar_length - done)}]"
+    progress_percentage = f"{str(int(fraction_done * 100)).rjust(3)}%"
+    size_done = current_length / 1024 / 1024
+    size_total = total_length / 1024 / 1024
+    speed = size_done / elapsed_time if elapsed_time > 0 else 0  # MB/s
+    return f"\r {count_msg} {progress_percentage} {progress_bar} {time_left} - {speed:.2f} MB/s - {size_done:.2f}/{size_total:.2f} MB"
+
+
+def show_download_progress(
+    file: BinaryIO,
+    count_msg: str,
+    total_length: int,
+    start_time: float,
+    is_download_finished: threading.Event,
+) -> None:
+    """Shows progress bar of a file being written until the download is finished."""
+    while not is_download_finished.wait(PROGRESS_BAR_UPDATE_INTERVAL_SECONDS):
+        console_exclusive_info(
+            get_progress_bar_message(
+                count_msg, file.tell(), total_length, time.time() - start_time
+            ),
+            end="\r",
+        )
+
+
 def unzip_file(
     filepath: str,
     delete: bool = False,
@@ -576,6 +691,7 @@ def unzip_file(
     counter: int | None = None,
     total_count: int | None = None,
     logger: Logger | None = None,
+    show_progress: bool = True,
 ) -> bool:
     """
     Extracts file and optionally deletes the original ZIP file upon success or error.
@@ -587,6 +703,7 @@ def unzip_file(
         counter (int or None, optional): A counter to track progress during extraction. Defaults to None.
         total_count (int or None, optional): The total number of files to extract, used for progress tracking. Defaults to None.
         logger (Logger or None, optional): A logger instance to log progress and errors. Defaults to None.
+        show_progress (bool, optional): If True, a progress message is shown in the console while extracting. Defaults to True.
 
     Returns:
         bool: True if the extraction was successful, False otherwise.
@@ -598,7 +715,7 @@ def unzip_file(
             logger.info(f" {count_msg} File not found: <{filepath}>")
         return False
 
-    if logger:
+    if logger and show_progress:
         console_exclusive_info(f" {count_msg} Extracting...", end="\r")
     new_filepath = os.path.join(
         os.path.dirname(filepath), os.path.basename(filepath).split(".")[0]
@@ -629,13 +746,21 @@ def unzip_file(
     return True
 
 
+@lru_cache(maxsize=1024)
+def _format_datetime_string(datetime_string: str) -> str:
+    """Formats time string (results are cached, errors are not)."""
+    import pandas as pd
+
+    timestamp = pd.Timestamp(datetime_string)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def format_datetime_string(datetime_string: str, logger: Logger | None = None) -> str:
     """Formats time string and raises ValueError if unsuccessful."""
     try:
-        timestamp = pd.Timestamp(datetime_string)
-        if timestamp.tzinfo is None:
-            timestamp = timestamp.tz_localize("UTC")
-        return timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return _format_datetime_string(datetime_string)
     except ValueError as e:
         msg = f"Given time string '{datetime_string}' is not valid. Here is the original error:"
         if logger:
@@ -762,15 +887,13 @@ def get_product_type_and_version_from_string(
 
         short_names.append(short_name.upper())
 
-    msg = ""
-    msg2 = ""
-    for i in range(len(file_types)):
-        if i % 6 == 0:
-            msg += "\n" + file_types[i]
-            msg2 += "\n" + short_names[i]
-        else:
-            msg += "\t" + file_types[i]
-            msg2 += "\t" + short_names[i]
+    msg_lines = []
+    msg2_lines = []
+    for i in range(0, len(file_types), 6):
+        msg_lines.append("\t".join(file_types[i : i + 6]))
+        msg2_lines.append("\t".join(short_names[i : i + 6]))
+    msg = "\n" + "\n".join(msg_lines)
+    msg2 = "\n" + "\n".join(msg2_lines)
 
     exception_msg = f'The user input "{input_string}" is either not a valid product name or not supported by this function.\n{msg}\n\nor use the respective short hands (additional non letter characters like - or _ are also allowed, e.g. A-NOM):\n{msg2}'
     if logger:
@@ -831,6 +954,12 @@ def get_applicable_collection_list(product_type: str) -> list[str]:
     return collection_list
 
 
+_PLACEHOLDER_PATTERN: Final[re.Pattern] = re.compile(r"\{([^}?]+)\??\}")
+_EMPTY_PARAM_PATTERN: Final[re.Pattern] = re.compile(r"&?[a-zA-Z]*=\{.*?\}")
+_REMNANT_PARAM_PATTERN: Final[re.Pattern] = re.compile(r".?\{.*?\}")
+_BRACKET_TRANSLATION_TABLE: Final[dict[int, int]] = str.maketrans("[]", "{}")
+
+
 def get_api_request(
     url_template: str,
     opensearch_request_parameters: dict,
@@ -839,41 +968,37 @@ def get_api_request(
 ) -> str:
     "Substitutes OpenSearch request parameters in given template"
     opensearch_namespace = "os:"
-
-    # Parameter substitution
-    for os_param in opensearch_request_parameters:
-        url_template, num_substitutions_made = re.subn(
-            r"\{" + os_param + r".*?\}",
-            opensearch_request_parameters[os_param],
-            url_template,
-        )
-        if num_substitutions_made < 1:
-            if ":" in os_param:
-                if logger:
-                    logger.warning("Parameter " + os_param + " not found in template.")
-            else:
-                # Fall back to opensearch_namespace if no namespace provided
-                url_template, num_substitutions_made = re.subn(
-                    r"\{" + opensearch_namespace + os_param + r".*?\}",
-                    opensearch_request_parameters[os_param],
-                    url_template,
-                )
-                if num_substitutions_made < 1:
-                    if logger:
-                        logger.warning(
-                            "Parameter "
-                            + opensearch_namespace
-                            + os_param
-                            + " not found in template."
-                        )
-
-    # Remove empty parameters (field-value pairs, e.g. '&bbox={geo:box?}')
-    url_template = re.sub(r"&?[a-zA-Z]*=\{.*?\}", "", url_template)
-    # Remove remnants of partially removed parameters (e.g. '/{time:end?}' which originally was part of '&datetime={time:start?}/{time:end?}')
-    url_template = re.sub(r".?\{.*?\}", "", url_template)
+    params = opensearch_request_parameters
+    used_params: set[str] = set()
+
+    def substitute(match: re.Match) -> str:
+        name = match.group(1)
+        if name not in params and name.startswith(opensearch_namespace):
+            # Fall back to parameters given without opensearch_namespace
+            name = name[len(opensearch_namespace) :]
+        if name not in params:
+            # Unresolved placeholders are removed below
+            return match.group(0)
+        used_params.add(name)
+        return params[name]
+
+    if "{" in url_template:
+        # Parameter substitution (single pass over all placeholders)
+        url_template = _PLACEHOLDER_PATTERN.sub(substitute, url_template)
+        # Remove empty parameters (field-value pairs, e.g. '&bbox={geo:box?}')
+        url_template = _EMPTY_PARAM_PATTERN.sub("", url_template)
+        # Remove remnants of partially removed parameters (e.g. '/{time:end?}' which originally was part of '&datetime={time:start?}/{time:end?}')
+        url_template = _REMNANT_PARAM_PATTERN.sub("", url_template)
+    if logger:
+        for os_param in params:
+            if os_param not in used_params:
+                if ":" not in os_param:
+                    os_param = opensearch_namespace + os_param
+                logger.warning("Parameter " + os_param + " not found in template.")
 
     # Correct list charecters
-    url_template = url_template.replace("[", "{").replace("]", "}")
+    if "[" in url_template or "]" in url_template:
+        url_template = url_template.translate(_BRACKET_TRANSLATION_TABLE)
 
     if logger:
         if msg_prefix is None:
@@ -883,16 +1008,22 @@ def get_api_request(
     return url_template
 
 
-def safe_parse_timestamp(timestamp: str) -> pd.Timestamp:
+@lru_cache(maxsize=4096)
+def safe_parse_timestamp(timestamp: str) -> "pd.Timestamp":
     """Converts string to valid pandas.Timestamp, returns min timestamp on error."""
+    import pandas as pd
+
     try:
         return pd.to_datetime(timestamp, errors="raise")
-    except (DateParseError, ValueError):
+    except ValueError:  # Includes pandas' DateParseError
         return pd.Timestamp.min
 
 
-def get_product_info_from_path(filepath: str) -> dict[str, str | int | pd.Timestamp]:
-    """Gathers product information contained in it's file name."""
+@lru_cache(maxsize=8192)
+def get_product_info_from_path(
+    filepath: str,
+) -> "dict[str, str | int | pd.Timestamp]":
+    """Gathers product information contained in it's file name (cached, do not modify the returned dict)."""
     filename = os.path.basename(filepath).split(".")[0]
     if len(filename) < 60:
         frame_id = "-"
@@ -905,7 +1036,7 @@ def get_product_info_from_path(filepath: str) -> dict[str, str | int | pd.Timest
 
     product_name = filename[9:19]
 
-    filename_info: dict[str, str | int | pd.Timestamp] = dict(
+    filename_info: "dict[str, str | int | pd.Timestamp]" = dict(
         filepath=filepath,
         dirpath=os.path.dirname(filepath),
         filename=filename,
@@ -927,54 +1058,347 @@ def get_product_info_from_path(filepath: str) -> dict[str, str | int | pd.Timest
     return filename_info
 
 
+_SPECIAL_PRODUCT_SUB_DIRNAMES: Final[dict[str, str]] = {
+    "AUX_JSG_1D": SUBDIR_NAME_AUX_FILES,
+    "AUX_MET_1D": SUBDIR_NAME_AUX_FILES,
+    "MPL_ORBSCT": SUBDIR_NAME_ORB_FILES,
+    "AUX_ORBPRE": SUBDIR_NAME_ORB_FILES,
+    "AUX_ORBRES": SUBDIR_NAME_ORB_FILES,
+}
+_LEVEL_SUB_DIRNAMES: Final[dict[str, str]] = {
+    "1B": SUBDIR_NAME_L1B_FILES,
+    "1C": SUBDIR_NAME_L1C_FILES,
+    "2A": SUBDIR_NAME_L2A_FILES,
+    "2B": SUBDIR_NAME_L2B_FILES,
+}
+
+
+@lru_cache(maxsize=256)
 def get_product_sub_dirname(product_name: str) -> str:
     """Returns level subfolder name of given product name."""
-    if product_name in ["AUX_JSG_1D", "AUX_MET_1D"]:
-        sub_dirname = SUBDIR_NAME_AUX_FILES
-    elif product_name in ["MPL_ORBSCT", "AUX_ORBPRE", "AUX_ORBRES"]:
-        sub_dirname = SUBDIR_NAME_ORB_FILES
-    elif "0" in product_name.lower():
-        sub_dirname = SUBDIR_NAME_L0__FILES
-    elif "1b" in product_name.lower():
-        sub_dirname = SUBDIR_NAME_L1B_FILES
-    elif "1c" in product_name.lower():
-        sub_dirname = SUBDIR_NAME_L1C_FILES
-    elif "2a" in product_name.lower():
-        sub_dirname = SUBDIR_NAME_L2A_FILES
-    elif "2b" in product_name.lower():
-        sub_dirname = SUBDIR_NAME_L2B_FILES
+    sub_dirname = _SPECIAL_PRODUCT_SUB_DIRNAMES.get(product_name)
+    if sub_dirname is None:
+        # The processing level is given by the last two characters of the name
+        sub_dirname = _LEVEL_SUB_DIRNAMES.get(
+            product_name[-2:].upper(), SUBDIR_NAME_L0__FILES
+        )
     return sub_dirname
 
 
 def ensure_single_zip_extension(filename):
     """Returns given file name with a single .ZIP extension (e.g. 'file.ZIP.zip' -> 'file.ZIP')."""
+    # Common case: a single .zip suffix of any case
+    base_name = filename[:-4]
+    if filename[-4:].lower() == ".zip" and base_name and "." not in base_name:
+        return base_name + ".ZIP"
     base_name, ext = os.path.splitext(filename)
     while ext.lower() == ".zip":
         base_name, ext = os.path.splitext(base_name)
     return base_name + ".ZIP"
 
 
+@lru_cache(maxsize=1024)
+def _join_product_dirpath(
+    dirpath_local: str, product_name: str, year: int, month: int, day: int
+) -> str:
+    """Joins local path to subfolder of given product and sensing date."""
+    sub_dirname = get_product_sub_dirname(product_name)
+    return os.path.join(
+        dirpath_local,
+        sub_dirname,
+        product_name,
+        str(year).zfill(4),
+        str(month).zfill(2),
+        str(day).zfill(2),
+    )
+
+
 def get_local_product_dirpath(dirpath_local, filename, create_subdirs=True):
     """Creates local path to file."""
-    if create_subdirs:
-        row = get_product_info_from_path(filename)
+    if not create_subdirs:
+        # File name is not parsed if no subfolders are used
+        return dirpath_local
+
+    row = get_product_info_from_path(filename)
+    sensing_start_time = row["sensing_start_time"]
+    return _join_product_dirpath(
+        dirpath_local,
+        row["product_name"],
+        sensing_start_time.year,
+        sensing_start_time.month,
+        sensing_start_time.day,
+    )
 
-        product_name = row["product_name"]
-        year = str(row["sensing_start_time"].year).zfill(4)
-        month = str(row["sensing_start_time"].month).zfill(2)
-        day = str(row["sensing_start_time"].day).zfill(2)
 
-        sub_dirname = get_product_sub_dirname(product_name)
-        product_dirpath_local = os.path.join(
-            dirpath_local, sub_dirname, product_name, year, month, day
-        )
-    else:
-        product_dirpath_local = dirpath_local
-    return product_dirpath_local
+def create_session(proxies: dict | None = None) -> requests.Session:
+    """Creates a `requests.Session` with a connection pool that is reused across requests."""
+    session = requests.Session()
+    if proxies:
+        session.proxies.update(proxies)
+    adapter = HTTPAdapter(
+        pool_connections=8, pool_maxsize=32, max_retries=Retry(total=0)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download_file(
+    session: requests.Session,
+    file_download_url: str,
+    download_directory: str,
+    is_overwrite: bool,
+    is_unzip: bool,
+    is_delete: bool,
+    is_create_subdirs: bool,
+    counter: int | None = None,
+    total_count: int | None = None,
+    show_progress: bool = True,
+    created_dirpaths: set[str] | None = None,
+    is_download_cancelled: threading.Event | None = None,
+    open_responses: set[requests.Response] | None = None,
+    logger: Logger | None = None,
+) -> tuple[int, int, float, float]:
+    """
+    Downloads a single file using an authenticated OADS session and optionally extracts it.
+
+    Args:
+        session (requests.Session): Session logged in to the OADS server storing the file.
+        file_download_url (str): The file URL.
+        download_directory (str): Target directory for storing downloaded files.
+        is_overwrite (bool): If True, overwrite existing files.
+        is_unzip (bool): If True, extract downloaded archives.
+        is_delete (bool): If True, delete archives after extraction.
+        is_create_subdirs (bool): If True, place files in subfolder structure.
+        counter (int or None, optional): Position of the file in the download list. Defaults to None.
+        total_count (int or None, optional): The total number of files to download. Defaults to None.
+        show_progress (bool, optional): If True, a progress bar is shown in the console. Defaults to True.
+        created_dirpaths (set[str] or None, optional): Directories known to exist, shared between calls to skip repeated creation. Defaults to None.
+        is_download_cancelled (threading.Event or None, optional): Event set by the caller to abort the download, which then raises DownloadCancelledError. Defaults to None.
+        open_responses (set[requests.Response] or None, optional): Responses currently being downloaded, shared so that the caller can close them on cancellation. Defaults to None.
+        logger (Logger | None, optional): Logger instance for logging messages.
+
+    Returns:
+        tuple: Number of completed downloads, number of extracted files and sums of download sizes (MB) and speeds (MB/s).
+    """
+    if is_download_cancelled is None:
+        is_download_cancelled = threading.Event()
+    if open_responses is None:
+        open_responses = set()
+    download_counter = 0
+    unzip_counter = 0
+    download_size_sum = 0.0
+    download_speed_sum = 0.0
+    count_msg, _ = get_counter_message(counter=counter, total_count=total_count)
+
+    success = False
+
+    # Extracting the filename from the download link
+    file_name = file_download_url.split("/")[-1]
+    product_dirpath = get_local_product_dirpath(
+        download_directory, file_name, create_subdirs=is_create_subdirs
+    )
+    # Make sure the local download_directory exists (if not create it)
+    if created_dirpaths is None or product_dirpath not in created_dirpaths:
+        os.makedirs(product_dirpath, exist_ok=True)
+        if created_dirpaths is not None:
+            created_dirpaths.add(product_dirpath)
+    # Some files may be missing zip file extension so we need to fix them
+    file_name = ensure_single_zip_extension(file_name)
+    zip_file_path = os.path.join(product_dirpath, file_name)
+    file_path = zip_file_path[0:-4]
+
+    if logger:
+        logger.info(f"*{count_msg} Starting: {file_name[0:-4]}")
+
+    for attempt in range(MAX_DOWNLOAD_ATTEMPTS_PER_FILE):
+        if is_download_cancelled.is_set():
+            raise DownloadCancelledError(f"Download cancelled: {file_name}")
+        if attempt > 0:
+            if logger:
+                logger.info(
+                    f" {count_msg} Restarting (starting try {attempt + 1} of max. {MAX_DOWNLOAD_ATTEMPTS_PER_FILE})."
+                )
+
+        success = True
+
+        # Check existing files
+        zip_file_exists = os.path.exists(zip_file_path)
+        file_exists = os.path.exists(file_path)
+
+        # Decide if file will be downloaded and extracted
+        try_download = is_overwrite or (not zip_file_exists and not file_exists)
+        try_unzip = is_unzip and (is_overwrite or not file_exists)
+
+        if not try_download:
+            if is_unzip:
+                if logger:
+                    logger.info(f" {count_msg} Skip file download.")
+            else:
+                if logger:
+                    logger.info(
+                        f" {count_msg} Skip file download. (see <{zip_file_path}>)"
+                    )
+        if not try_unzip:
+            if logger:
+                logger.info(f" {count_msg} Skip file unzip. (see <{file_path}>)")
+        if not try_download and not try_unzip:
+            break
+
+        # Delete unnessecary zip files
+        if is_delete and file_exists and zip_file_exists:
+            os.remove(zip_file_path)
+            zip_file_exists = False
+
+        # Overwrite files
+        if zip_file_exists and is_overwrite:
+            os.remove(zip_file_path)
+            zip_file_exists = False
+        if file_exists and is_overwrite:
+            os.remove(file_path)
+            file_exists = False
+
+        # Download zip file
+        if try_download:
+            try:
+                # Requesting the product download
+                if logger:
+                    logger.debug(f" {count_msg} Requesting: {file_download_url}")
+                file_download_response = session.get(
+                    file_download_url,
+                    stream=True,
+                )
+                # Closing the response from another thread aborts the download
+                open_responses.add(file_download_response)
+                try:
+                    if is_download_cancelled.is_set():
+                        raise DownloadCancelledError(f"Download cancelled: {file_name}")
+                    validate_request_response(file_download_response, logger=logger)
+
+                    with open(zip_file_path, "wb") as f:
+                        total_length_str = file_download_response.headers.get(
+                            "content-length"
+                        )
+                        if not isinstance(total_length_str, str):
+                            f.write(file_download_response.content)
+                        else:
+                            total_length = int(total_length_str)
+                            start_time = time.time()
+                            # The progress bar is updated by a separate thread, so
+                            # the response body can be copied without interruption
+                            is_download_finished = threading.Event()
+                            progress_thread = None
+                            if logger and show_progress:
+                                progress_thread = threading.Thread(
+                                    target=show_download_progress,
+                                    args=(
+                                        f,
+                                        count_msg,
+                                        total_length,
+                                        start_time,
+                                        is_download_finished,
+                                    ),
+                                    daemon=True,
+                                )
+                                progress_thread.start()
+                            try:
+                                file_download_response.raw.decode_content = True
+                                shutil.copyfileobj(
+                                    file_download_response.raw,
+                                    f,
+                                    length=CHUNK_SIZE_BYTES,
+                                )
+                            finally:
+                                is_download_finished.set()
+                                if progress_thread:
+                                    progress_thread.join()
+                            # A closed response may end the copy without an error
+                            if is_download_cancelled.is_set():
+                                raise DownloadCancelledError(
+                                    f"Download cancelled: {file_name}"
+                                )
+                            current_length = f.tell()
+                            elapsed_time = time.time() - start_time
+                            size_done = current_length / 1024 / 1024
+                            size_total = total_length / 1024 / 1024
+                            speed = (
+                                size_done / elapsed_time if elapsed_time > 0 else 0
+                            )  # MB/s
+                            time_taken = time.strftime(
+                                "%H:%M:%S",
+                                time.gmtime(int(time.time() - start_time)),
+                            )
+                            if logger:
+                                logger.info(
+                                    f" {count_msg} Download completed ({time_taken} - {speed:.2f} MB/s - {size_done:.2f}/{size_total:.2f} MB)                   "
+                                )
+                            download_size_sum += size_total
+                            download_speed_sum += speed
+                            download_counter += 1
+                except BaseException as e:
+                    if not is_download_cancelled.is_set():
+                        raise
+                    # Partially written files of cancelled downloads are removed
+                    file_download_response.close()
+                    if os.path.exists(zip_file_path):
+                        os.remove(zip_file_path)
+                    if isinstance(e, DownloadCancelledError):
+                        raise
+                    raise DownloadCancelledError(
+                        f"Download cancelled: {file_name}"
+                    ) from e
+                finally:
+                    open_responses.discard(file_download_response)
+            except (
+                requests.exceptions.RequestException,
+                urllib3.exceptions.HTTPError,  # Raised while reading the raw response
+            ) as e:
+                is_error_403_forbidden = False
+                response = getattr(e, "response", None)
+                if response is not None:  # Ensure response exists
+                    is_error_403_forbidden = response.status_code == 403
+                if is_error_403_forbidden:
+                    attempt = MAX_DOWNLOAD_ATTEMPTS_PER_FILE
+                    if logger:
+                        logger.error(f"DOWNLOAD FAILED: {e}")
+                        logger.error(
+                            f"Make sure that you only use OADS collections that you are allowed to access in your config.toml (see section 'Setup' in README)!"
+                        )
+                else:
+                    if logger:
+                        logger.info(
+                            f" {count_msg} DOWNLOAD FAILED for attempt {attempt + 1} of {MAX_DOWNLOAD_ATTEMPTS_PER_FILE}: {e}"
+                        )
+                    # Wait for 2 seconds before retrying (unless cancelled)
+                    is_download_cancelled.wait(2)
+
+            download_success = os.path.exists(zip_file_path)
+            success &= download_success
+
+        # Unzip zip file
+        if try_unzip:
+            success = unzip_file(
+                zip_file_path,
+                delete=is_delete,
+                delete_on_error=True,
+                total_count=total_count,
+                counter=counter,
+                logger=logger,
+                show_progress=show_progress,
+            )
+            unzip_success = os.path.exists(file_path)
+            if unzip_success:
+                unzip_counter += 1
+            success &= unzip_success
+
+        if success:
+            break
+
+    return download_counter, unzip_counter, download_size_sum, download_speed_sum
 
 
 def download(
-    dataframe: pd.DataFrame,
+    dataframe: "pd.DataFrame",
     username: str,
     password: str,
     download_directory: str,
@@ -1005,9 +1429,20 @@ def download(
     counter = 1
     download_counter = 0
     unzip_counter = 0
-    download_sizes = []
-    download_speeds = []
-    for server, df_group in dataframe.groupby("server"):
+    total_download_size = 0.0
+    download_speed_sum = 0.0
+    created_dirpaths: set[str] = set()
+    # Shared with the download threads to abort running downloads
+    is_download_cancelled = threading.Event()
+    open_responses: set[requests.Response] = set()
+    # Grouping is skipped in the common case that all files are on the same server
+    servers = dataframe["server"].unique()
+    server_groups = (
+        [(servers[0], dataframe)]
+        if len(servers) == 1
+        else dataframe.groupby("server", sort=False)
+    )
+    for server, df_group in server_groups:
         proxies: dict = {}
 
         oads_hostname = server
@@ -1015,289 +1450,144 @@ def download(
             logger.info(f"Selecting dissemination service: {oads_hostname}")
         eoiam_idp_hostname = "eoiam-idp.eo.esa.int"
 
-        # Requesting access to the OADS server storing the products
-        access_response = requests.get(
-            f"https://{oads_hostname}/oads/access/login", proxies=proxies
-        )
-        validate_request_response(access_response, logger=logger)
-
-        # Extracting the cookies from the response
-        access_response_cookies = access_response.cookies
-        for r in access_response.history:
-            access_response_cookies = requests.cookies.merge_cookies(
-                access_response_cookies, r.cookies
+        # Connections, cookies and proxies are kept by the session for all requests to this server
+        with create_session(proxies=proxies) as session:
+            # Requesting access to the OADS server storing the products
+            access_response = session.get(f"https://{oads_hostname}/oads/access/login")
+            validate_request_response(access_response, logger=logger)
+
+            # Cookies of the response (including redirects) are kept by the session
+            tree = html.fromstring(access_response.content)
+
+            # Extracting the sessionDataKey from the the response
+            sessionDataKey = tree.findall(".//input[@name = 'sessionDataKey']")[
+                0
+            ].attrib["value"]
+
+            # Defining login request
+            post_data = {
+                "tocommonauth": "true",
+                "username": username,
+                "password": password,
+                "sessionDataKey": sessionDataKey,
+            }
+
+            # Sending the login request to the authentication platform
+            auth_url = f"https://{eoiam_idp_hostname}/samlsso"
+            auth_response = session.post(
+                url=auth_url,
+                data=post_data,
             )
-        tree = html.fromstring(access_response.content)
+            validate_request_response(auth_response, logger=logger)
 
-        # Extracting the sessionDataKey from the the response
-        sessionDataKey = tree.findall(".//input[@name = 'sessionDataKey']")[0].attrib[
-            "value"
-        ]
-
-        # Defining login request
-        post_data = {
-            "tocommonauth": "true",
-            "username": username,
-            "password": password,
-            "sessionDataKey": sessionDataKey,
-        }
+            # Parsing the response from authentication platform
+            tree = html.fromstring(auth_response.content)
+            # if logger: logger.debug(html.tostring(tree, pretty_print=True))
 
-        # Sending the login request to the authentication platform
-        auth_url = f"https://{eoiam_idp_hostname}/samlsso"
-        auth_response = requests.post(
-            url=auth_url,
-            data=post_data,
-            cookies=access_response_cookies,
-            proxies=proxies,
-        )
-        validate_request_response(auth_response, logger=logger)
-
-        # Parsing the response from authentication platform
-        tree = html.fromstring(auth_response.content)
-        # responseView = BeautifulSoup(auth_response.text, 'html.parser')
-        # if logger: logger.debug(responseView)
-
-        # Extracting the variables needed to redirect from a successful authentication to OADS
-        try:
-            relayState = tree.findall(".//input[@name='RelayState']")[0].attrib["value"]
-            samlResponse = tree.findall(".//input[@name='SAMLResponse']")[0].attrib[
-                "value"
+            # Extracting the variables needed to redirect from a successful authentication to OADS
+            try:
+                relayState = tree.findall(".//input[@name='RelayState']")[0].attrib[
+                    "value"
+                ]
+                samlResponse = tree.findall(".//input[@name='SAMLResponse']")[0].attrib[
+                    "value"
+                ]
+            except IndexError as e:
+                exception_msg = "OADS did not responde as expected. Check your configuration file for valid a username and password."
+                if logger:
+                    logger.exception(exception_msg)
+                raise BadResponseError(exception_msg)
+
+            # Defining the SAML redirection request to OADS
+            post_data = {
+                "RelayState": relayState,
+                "SAMLResponse": samlResponse,
+            }
+
+            # Sending the SAML redirection request to OADS
+            saml_redirect_url = tree.findall(".//form[@method='post']")[0].attrib[
+                "action"
             ]
-        except IndexError as e:
-            exception_msg = "OADS did not responde as expected. Check your configuration file for valid a username and password."
-            if logger:
-                logger.exception(exception_msg)
-            raise BadResponseError(exception_msg)
-
-        # Defining the SAML redirection request to OADS
-        post_data = {
-            "RelayState": relayState,
-            "SAMLResponse": samlResponse,
-        }
-
-        # Sending the SAML redirection request to OADS
-        saml_redirect_url = tree.findall(".//form[@method='post']")[0].attrib["action"]
-        saml_response = requests.post(
-            url=saml_redirect_url, data=post_data, proxies=proxies
-        )
-        validate_request_response(saml_response, logger=logger)
-
-        saml_response_cookies = saml_response.cookies
-        for r in saml_response.history:
-            saml_response_cookies = requests.cookies.merge_cookies(
-                saml_response_cookies, r.cookies
-            )
-
-        # Downloading Products
-        for index, row in df_group.iterrows():
-            count_msg, _ = get_counter_message(counter=counter, total_count=total_count)
-
-            success = False
-
-            # Extracting the filename from the download link
-            file_name = (row["download_url"]).split("/")[-1]
-            product_dirpath = get_local_product_dirpath(
-                download_directory, file_name, create_subdirs=is_create_subdirs
-            )
-            # Make sure the local download_directory exists (if not create it)
-            if not os.path.exists(product_dirpath):
-                os.makedirs(product_dirpath)
-            # Some files may be missing zip file extension so we need to fix them
-            file_name = ensure_single_zip_extension(file_name)
-            zip_file_path = os.path.join(product_dirpath, file_name)
-            file_path = zip_file_path[0:-4]
-
-            if logger:
-                logger.info(f"*{count_msg} Starting: {file_name[0:-4]}")
-
-            # Defining the download URL
-            file_download_url = row["download_url"]
-
-            for attempt in range(MAX_DOWNLOAD_ATTEMPTS_PER_FILE):
-                if attempt > 0:
-                    if logger:
-                        logger.info(
-                            f" {count_msg} Restarting (starting try {attempt + 1} of max. {MAX_DOWNLOAD_ATTEMPTS_PER_FILE})."
-                        )
-
-                success = True
-
-                # Check existing files
-                zip_file_exists = os.path.exists(zip_file_path)
-                file_exists = os.path.exists(file_path)
-
-                # Decide if file will be downloaded and extracted
-                try_download = is_overwrite or (not zip_file_exists and not file_exists)
-                try_unzip = is_unzip and (is_overwrite or not file_exists)
-
-                if not try_download:
-                    if is_unzip:
-                        if logger:
-                            logger.info(f" {count_msg} Skip file download.")
-                    else:
-                        if logger:
-                            logger.info(
-                                f" {count_msg} Skip file download. (see <{zip_file_path}>)"
-                            )
-                if not try_unzip:
-                    if logger:
-                        logger.info(
-                            f" {count_msg} Skip file unzip. (see <{file_path}>)"
-                        )
-                if not try_download and not try_unzip:
-                    counter += 1
-                    break
-
-                # Delete unnessecary zip files
-                if is_delete and file_exists and zip_file_exists:
-                    os.remove(zip_file_path)
-                    zip_file_exists = False
-
-                # Overwrite files
-                if zip_file_exists and is_overwrite:
-                    os.remove(zip_file_path)
-                    zip_file_exists = False
-                if file_exists and is_overwrite:
-                    os.remove(file_path)
-                    file_exists = False
-
-                # Download zip file
-                if try_download:
-                    try:
-                        # Requesting the product download
-                        if logger:
-                            logger.debug(
-                                f" {count_msg} Requesting: {file_download_url}"
-                            )
-                        file_download_response = requests.get(
+            saml_response = session.post(url=saml_redirect_url, data=post_data)
+            validate_request_response(saml_response, logger=logger)
+
+            # Downloading Products (in parallel if MAX_NUM_PARALLEL_DOWNLOADS > 1)
+            num_workers = min(MAX_NUM_PARALLEL_DOWNLOADS, len(df_group))
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                futures = []
+                for file_download_url in df_group["download_url"].tolist():
+                    futures.append(
+                        executor.submit(
+                            download_file,
+                            session,
                             file_download_url,
-                            cookies=saml_response_cookies,
-                            proxies=proxies,
-                            stream=True,
+                            download_directory,
+                            is_overwrite,
+                            is_unzip,
+                            is_delete,
+                            is_create_subdirs,
+                            counter=counter,
+                            total_count=total_count,
+                            show_progress=num_workers == 1,
+                            created_dirpaths=created_dirpaths,
+                            is_download_cancelled=is_download_cancelled,
+                            open_responses=open_responses,
+                            logger=logger,
                         )
-                        validate_request_response(file_download_response, logger=logger)
-
-                        with open(zip_file_path, "wb") as f:
-                            total_length_str = file_download_response.headers.get(
-                                "content-length"
-                            )
-                            if not isinstance(total_length_str, str):
-                                f.write(file_download_response.content)
-                            else:
-                                current_length = 0
-                                total_length = int(total_length_str)
-                                start_time = time.time()
-                                progress_bar_length = 30
-                                for data in file_download_response.iter_content(
-                                    chunk_size=CHUNK_SIZE_BYTES
-                                ):
-                                    current_length += len(data)
-                                    f.write(data)
-                                    done = int(
-                                        progress_bar_length
-                                        * current_length
-                                        / total_length
-                                    )
-                                    time_elapsed = time.time() - start_time
-                                    time_estimated = (
-                                        time_elapsed / current_length
-                                    ) * total_length
-                                    time_left = time.strftime(
-                                        "%H:%M:%S",
-                                        time.gmtime(int(time_estimated - time_elapsed)),
-                                    )
-                                    progress_bar = f"[{'#' * done}{'-' * (progress_bar_length - done)}]"
-                                    progress_percentage = f"{str(int((current_length / total_length) * 100)).rjust(3)}%"
-                                    elapsed_time = time.time() - start_time
-                                    size_done = current_length / 1024 / 1024
-                                    size_total = total_length / 1024 / 1024
-                                    speed = (
-                                        size_done / elapsed_time
-                                        if elapsed_time > 0
-                                        else 0
-                                    )  # MB/s
-                                    if logger:
-                                        console_exclusive_info(
-                                            f"\r {count_msg} {progress_percentage} {progress_bar} {time_left} - {speed:.2f} MB/s - {size_done:.2f}/{size_total:.2f} MB",
-                                            end="\r",
-                                        )
-                                time_taken = time.strftime(
-                                    "%H:%M:%S",
-                                    time.gmtime(int(time.time() - start_time)),
-                                )
-                                if logger:
-                                    logger.info(
-                                        f" {count_msg} Download completed ({time_taken} - {speed:.2f} MB/s - {size_done:.2f}/{size_total:.2f} MB)                   "
-                                    )
-                                download_sizes.append(size_total)
-                                download_speeds.append(speed)
-                                download_counter += 1
-                    except requests.exceptions.RequestException as e:
-                        is_error_403_forbidden = False
-                        if e.response is not None:  # Ensure response exists
-                            is_error_403_forbidden = e.response.status_code == 403
-                        if is_error_403_forbidden:
-                            attempt = MAX_DOWNLOAD_ATTEMPTS_PER_FILE
-                            if logger:
-                                logger.error(f"DOWNLOAD FAILED: {e}")
-                                logger.error(
-                                    f"Make sure that you only use OADS collections that you are allowed to access in your config.toml (see section 'Setup' in README)!"
-                                )
-                        else:
-                            if logger:
-                                logger.info(
-                                    f" {count_msg} DOWNLOAD FAILED for attempt {attempt + 1} of {MAX_DOWNLOAD_ATTEMPTS_PER_FILE}: {e}"
-                                )
-                            time.sleep(2)  # Wait for 2 seconds before retrying
-
-                    download_success = os.path.exists(zip_file_path)
-                    success &= download_success
-
-                # Unzip zip file
-                if try_unzip:
-                    success = unzip_file(
-                        zip_file_path,
-                        delete=is_delete,
-                        delete_on_error=True,
-                        total_count=total_count,
-                        counter=counter,
-                        logger=logger,
                     )
-                    unzip_success = os.path.exists(file_path)
-                    if unzip_success:
-                        unzip_counter += 1
-                    success &= unzip_success
-
-                if success:
                     counter += 1
-                    break
-
-        # Logout of authentication platform and OADS
-        with requests.get(
-            f"https://{oads_hostname}/oads/Shibboleth.sso/Logout",
-            proxies=proxies,
-            stream=True,
-        ) as _:
-            pass
-        with requests.get(
-            f"https://{eoiam_idp_hostname}/Shibboleth.sso/Logout",
-            proxies=proxies,
-            stream=True,
-        ) as _:
-            pass
-
-    total_download_size = 0 if len(download_sizes) == 0 else np.sum(download_sizes)
-    mean_download_speed = 0 if len(download_speeds) == 0 else np.mean(download_speeds)
+                try:
+                    for future in as_completed(futures):
+                        (
+                            file_download_counter,
+                            file_unzip_counter,
+                            file_download_size,
+                            file_download_speed,
+                        ) = future.result()
+                        download_counter += file_download_counter
+                        unzip_counter += file_unzip_counter
+                        total_download_size += file_download_size
+                        download_speed_sum += file_download_speed
+                except BaseException:
+                    # Pending downloads are dropped and running ones are aborted
+                    # on errors or user interruption
+                    is_download_cancelled.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    for response in list(open_responses):
+                        try:
+                            # Unblocks reads waiting for data (urllib3 >= 2.3)
+                            response.raw.shutdown()
+                        except (AttributeError, ValueError, RuntimeError):
+                            pass
+                        response.close()
+                    raise
+
+            # Logout of authentication platform and OADS
+            with session.get(
+                f"https://{oads_hostname}/oads/Shibboleth.sso/Logout",
+                stream=True,
+            ) as _:
+                pass
+            with session.get(
+                f"https://{eoiam_idp_hostname}/Shibboleth.sso/Logout",
+                stream=True,
+            ) as _:
+                pass
+
+    mean_download_speed = (
+        download_speed_sum / download_counter if download_counter > 0 else 0
+    )
 
     return download_counter, unzip_counter, mean_download_speed, total_download_size
 
 
-def split_list_into_chunks(lst: list, size: int) -> list[list]:
-    """Splits a list into chunks or sublists each containing at most N elements"""
+def split_list_into_chunks(lst: list, size: int) -> Iterator[tuple]:
+    """Lazily splits a list into chunks or tuples each containing at most N elements"""
     iterator = iter(lst)
-    return [list(islice(iterator, size)) for _ in range((len(lst) + size - 1) // size)]
+    return iter(lambda: tuple(islice(iterator, size)), ())
 
 
+@lru_cache(maxsize=128)
 def encode_url(url: str) -> str:
     """Encode the URL, including its query string."""
     split_parsed_url = urlp.urlsplit(url)
@@ -1315,28 +1605,34 @@ def encode_url(url: str) -> str:
 
 def get_df(
     url_product_search_query: str,
+    session: requests.Session | None = None,
     logger: Logger | None = None,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """Performs given search request and returns results as `pandas.Dataframe`."""
+    import pandas as pd
+
     # Ensures that URL is properly encoded
-    url_product_search_query = url_product_search_query.replace("[", "{").replace(
-        "]", "}"
-    )
+    if "[" in url_product_search_query or "]" in url_product_search_query:
+        url_product_search_query = url_product_search_query.translate(
+            _BRACKET_TRANSLATION_TABLE
+        )
     url_product_search_query = encode_url(url_product_search_query)
 
     # Performs the request
-    response = get_request(url_product_search_query, logger=logger)
-    data_product_search_query = json.loads(response.text)
+    response = get_request(url_product_search_query, session=session, logger=logger)
+    data_product_search_query = json_loads(response.content)
 
-    # Creates dataframe from result
-    data = []
+    # Creates dataframe columns from result (server is the network location of the URL)
+    ids = []
+    servers = []
+    download_urls = []
     for d in data_product_search_query["features"]:
-        id = d["id"]
-        server = urlp.urlparse(d["assets"]["enclosure"]["href"]).netloc
         download_url = d["assets"]["enclosure"]["href"]
-        data.append((id, server, download_url))
+        ids.append(d["id"])
+        servers.append(download_url.split("/", 3)[2])
+        download_urls.append(download_url)
 
-    df = pd.DataFrame(data, columns=["id", "server", "download_url"])
+    df = pd.DataFrame({"id": ids, "server": servers, "download_url": download_urls})
     return df
 
 
@@ -1360,14 +1656,16 @@ def get_product_list_json(
     lat_text: str | None = None,
     lon_text: str | None = None,
     msg_prefix: str | None = "",
+    session: requests.Session | None = None,
     logger: Logger | None = None,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     Performs a product search based on given search criteria.
 
     Args:
         url_items (str): Base items URL that gets extended by other given search parameters.
         msg_prefix (str, optional): Prefix for log messages. Defaults to an empty string.
+        session (requests.Session | None, optional): Session whose connection pool is used for the request. Defaults to None.
         logger (Logger | None, optional): Logger instance for logging. Defaults to None.
 
     Returns:
@@ -1417,7 +1715,7 @@ def get_product_list_json(
         logger.debug(f"Constructed search request URL: {request_url}")
 
     # Extract the results into a dataframe
-    dataframe = get_df(request_url, logger=logger)
+    dataframe = get_df(request_url, session=session, logger=logger)
 
     return dataframe
 
@@ -1427,40 +1725,48 @@ def drop_duplicate_files(df, filename_column):
     if len(df) == 0:
         return df
 
-    # Keep only the latest file (i.e. with latest processing_start_time)
-    def extract_info(filename):
-        info = get_product_info_from_path(filename)
-        return (
-            info["product_name"],
-            info["sensing_start_time"],
-            info["processing_start_time"],
-        )
-
-    df[["product_name", "sensing_start_time", "processing_start_time"]] = (
-        df[filename_column].apply(extract_info).apply(pd.Series)
+    import pandas as pd
+
+    # Extract product information from the file names (see get_product_info_from_path)
+    filenames = df[filename_column].str.rsplit("/", n=1).str[-1].str.split(".").str[0]
+    df_info = pd.DataFrame(
+        dict(
+            product_name=filenames.str.slice(9, 19),
+            sensing_start_time=pd.to_datetime(
+                filenames.str.slice(20, 36),
+                format="%Y%m%dT%H%M%SZ",
+                errors="coerce",
+                cache=True,
+            ),
+            processing_start_time=pd.to_datetime(
+                filenames.str.slice(37, 53),
+                format="%Y%m%dT%H%M%SZ",
+                errors="coerce",
+                cache=True,
+            ),
+        ),
+        index=df.index,
     )
-    df = df.sort_values(
+
+    # Keep only the latest file (i.e. with latest processing_start_time)
+    df_info = df_info.sort_values(
         by=["product_name", "sensing_start_time", "processing_start_time"],
         ascending=[True, True, False],
     )
-    df = df.drop_duplicates(subset=["product_name", "sensing_start_time"], keep="first")
-    df = df.drop(
-        columns=["product_name", "sensing_start_time", "processing_start_time"]
+    df_info = df_info.drop_duplicates(
+        subset=["product_name", "sensing_start_time"], keep="first"
     )
 
-    return df.reset_index(drop=True)
+    return df.loc[df_info.index].reset_index(drop=True)
 
 
 def get_frame_range(start_frame_id: str, end_frame_id: str) -> list[str]:
     """Returns list of frames in order of selected range (e.g. A-D -> ABCD and D-A -> DEFGHA)."""
-    start_idx = FRAMES.index(start_frame_id)
-    end_idx = FRAMES.index(end_frame_id)
+    start_idx = _FRAME_INDICES[start_frame_id]
+    end_idx = _FRAME_INDICES[end_frame_id]
     if end_idx < start_idx:
         end_idx = end_idx + NUM_FRAMES
-    frame_id_range = [
-        FRAMES[idx % NUM_FRAMES] for idx in np.arange(start_idx, end_idx + 1)
-    ]
-    return frame_id_range
+    return [FRAMES[idx % NUM_FRAMES] for idx in range(start_idx, end_idx + 1)]
 
 
 def get_parsed_arguments() -> dict:
@@ -1687,18 +1993,25 @@ def get_time_queryparams(
         timestamp_queryparams = [
             format_datetime_string(t, logger=logger) for t in timestamps
         ]
-        for ts_queryparam in timestamp_queryparams:
+        # Formatted time strings can be compared lexicographically
+        if len(timestamp_queryparams) > 0:
             try:
-                if start_time_queryparam is not None:
-                    if ts_queryparam < start_time_queryparam:
-                        raise InvalidInputError(
-                            f"Timestamp ({ts_queryparam}) must be greater or equal the start time ({start_time})."
-                        )
-                if end_time_queryparam is not None:
-                    if ts_queryparam > end_time_queryparam:
-                        raise InvalidInputError(
-                            f"Timestamp ({ts_queryparam}) must be smaller or equal the end time ({end_time})."
-                        )
+                earliest_ts_queryparam = min(timestamp_queryparams)
+                if (
+                    start_time_queryparam is not None
+                    and earliest_ts_queryparam < start_time_queryparam
+                ):
+                    raise InvalidInputError(
+                        f"Timestamp ({earliest_ts_queryparam}) must be greater or equal the start time ({start_time})."
+                    )
+                latest_ts_queryparam = max(timestamp_queryparams)
+                if (
+                    end_time_queryparam is not None
+                    and latest_ts_queryparam > end_time_queryparam
+                ):
+                    raise InvalidInputError(
+                        f"Timestamp ({latest_ts_queryparam}) must be smaller or equal the end time ({end_time})."
+                    )
             except InvalidInputError as e:
                 if logger:
                     logger.exception(e)
@@ -1712,10 +2025,11 @@ def get_frame_queryparams(
     """Convert user's frame ID input to query parameters, that can be used in search requests."""
     frame_id_queryparams = None
     if frame_ids is not None:
-        frame_id_queryparams = [
-            get_validated_frame_id(f, logger=logger) for f in frame_ids
-        ]
-        is_all_frames = len([f for f in FRAMES if f not in frame_id_queryparams]) == 0
+        # Validated frames are deduplicated (e.g. for inputs like "-f a A")
+        frame_id_queryparams = list(
+            dict.fromkeys(get_validated_frame_id(f, logger=logger) for f in frame_ids)
+        )
+        is_all_frames = FRAMES_SET.issubset(frame_id_queryparams)
         if is_all_frames:
             if logger:
                 logger.warning(
@@ -1734,24 +2048,15 @@ def get_orbit_queryparams(
     orbit_number_queryparams: list[Orbit] = []
 
     if isinstance(orbit_numbers, list):
-        orbit_number_queryparams = [
-            int(x) for x in np.append(orbit_number_queryparams, orbit_numbers)
-        ]
+        orbit_number_queryparams.extend(orbit_numbers)
 
     orbit_number_range = get_validated_orbit_number_range(
         start_orbit_number, end_orbit_number, logger=logger
     )
     if isinstance(orbit_number_range, list):
-        orbit_number_queryparams = [
-            int(x) for x in np.append(orbit_number_queryparams, orbit_number_range)
-        ]
-
-    if isinstance(orbit_number_queryparams, list):
-        orbit_number_queryparams = [
-            int(x) for x in np.sort(np.unique(orbit_number_queryparams))
-        ]
+        orbit_number_queryparams.extend(orbit_number_range)
 
-    return orbit_number_queryparams
+    return sorted({int(x) for x in orbit_number_queryparams})
 
 
 def get_radius_queryparams(
@@ -1786,10 +2091,9 @@ def get_orbit_frame_tuple_list_from_separate_orbit_and_frame_lists(
     if orbits is None or len(orbits) == 0:
         return None
     if frames is None or len(frames) == 0:
-        frames = [f for f in FRAMES]
-    new_orbits = [int(x) for x in np.tile(orbits, len(frames))]
-    new_frames = [str(x) for x in np.repeat(frames, len(orbits))]
-    return list(zip(new_orbits, new_frames))
+        frames = list(FRAMES_TUPLE)
+    # Same order as tiling the orbits and repeating each frame
+    return [(int(o), str(f)) for f in frames for o in orbits]
 
 
 def get_orbit_frame_tuple_list_from_strings(
@@ -1823,7 +2127,7 @@ def get_orbit_frame_tuple_list_from_strings(
         end_orbit_number, end_frame_id = get_validated_orbit_and_frame(
             end_orbit_and_frame, logger=logger
         )
-        orbit_number_range = np.arange(start_orbit_number, end_orbit_number + 1)
+        orbit_number_range = range(start_orbit_number, end_orbit_number + 1)
         if len(orbit_number_range) == 1:
             orbit_numbers = [start_orbit_number] * len(frame_ids)
             frame_ids = get_frame_range(start_frame_id, end_frame_id)
@@ -1836,12 +2140,9 @@ def get_orbit_frame_tuple_list_from_strings(
 
             orbit_numbers = orbit_numbers_start + orbit_numbers_end
             frame_ids = frame_ids_start + frame_ids_end
-            if len(orbit_number_range) >= 3:
-                orbit_numbers_middle = orbit_number_range[1:-1]
-                for o in orbit_numbers_middle:
-                    for f in FRAMES:
-                        orbit_numbers.append(o)
-                        frame_ids.append(f)
+            for o in orbit_number_range[1:-1]:
+                orbit_numbers.extend([o] * NUM_FRAMES)
+                frame_ids.extend(FRAMES)
 
     if orbit_and_frames is not None:
         oaf_tuple_list = [
@@ -1877,35 +2178,78 @@ def create_list_of_search_requests(
     timestamp_queryparams: list[str] | None,
     complete_orbits: list[Orbit] | None,
     incomplete_orbits_frame_map: dict[Frame, list[Orbit]] | None,
-    frame_ids: list[Frame] | None,
+    frame_id_queryparams: list[Frame] | None,
+    selected_collections: frozenset[str] | None = None,
 ) -> list[SearchRequest]:
     """
     Creates a list of search requests based on product types, spatial and temporal
     query parameters, and orbit/frame information.
+    If selected_collections are given, other collections are not searched.
 
     Returns:
         list (list[SearchRequest]): A list of search request objects.
     """
+    # Spatial and temporal query parameters are the same for all products
+    geo_location_queryparams = dict(
+        radius=radius_queryparam,
+        lat=lat_queryparam,
+        lon=lon_queryparam,
+        bbox=bbox_queryparam,
+    )
+    if start_time_queryparam is None and end_time_queryparam is not None:
+        start_time_queryparam = format_datetime_string("2024-05-28T22:20:00Z")
+    if start_time_queryparam is not None and end_time_queryparam is None:
+        end_time_queryparam = datetime.datetime.now(datetime.timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+    time_queryparams = dict(
+        start_time=start_time_queryparam, end_time=end_time_queryparam
+    )
+    # Orbit numbers are validated and converted to strings only once for all products and chunks
+    orbit_strings: dict[Orbit, str] = {}
+    for o in chain(
+        complete_orbits or (), *(incomplete_orbits_frame_map or {}).values()
+    ):
+        if o not in orbit_strings:
+            orbit_strings[o] = str(get_validated_orbit_number(o))
+    # Orbit chunks are the same for all products
+    complete_orbits_chunk_queryparams = [
+        "[" + ",".join([orbit_strings[o] for o in complete_orbits_chunk]) + "]"
+        for complete_orbits_chunk in split_list_into_chunks(
+            complete_orbits or [], MAX_NUM_ORBITS_PER_REQUEST
+        )
+    ]
+    incomplete_orbits_chunk_queryparams = [
+        (
+            frame_id_queryparam,
+            "[" + ",".join([orbit_strings[o] for o in incomplete_orbits_chunk]) + "]",
+        )
+        for frame_id_queryparam, incomplete_orbits in (
+            incomplete_orbits_frame_map or {}
+        ).items()
+        for incomplete_orbits_chunk in split_list_into_chunks(
+            incomplete_orbits, MAX_NUM_ORBITS_PER_REQUEST
+        )
+    ]
+
     planned_requests = []
     for product_type, product_version in zip(product_types, product_versions):
+        collection_identifier_list = get_applicable_collection_list(product_type)
+        if selected_collections is not None:
+            collection_identifier_list = [
+                c for c in collection_identifier_list if c in selected_collections
+            ]
         basic_product_queryparams = dict(
-            collection_identifier_list=get_applicable_collection_list(product_type),
+            collection_identifier_list=collection_identifier_list,
             product_type=product_type,
             product_version=None if product_version == "latest" else product_version,
         )
-        geo_location_queryparams = dict(
-            radius=radius_queryparam,
-            lat=lat_queryparam,
-            lon=lon_queryparam,
-            bbox=bbox_queryparam,
-        )
-        if start_time_queryparam is None and end_time_queryparam is not None:
-            start_time_queryparam = format_datetime_string("2024-05-28T22:20:00Z")
-        if start_time_queryparam is not None and end_time_queryparam is None:
-            end_time_queryparam = format_datetime_string(str(pd.Timestamp.now()))
-        time_queryparams = dict(
-            start_time=start_time_queryparam, end_time=end_time_queryparam
-        )
+        # Parameters shared by all spatial/temporal requests of this product
+        baseline_queryparams = {
+            **basic_product_queryparams,
+            **geo_location_queryparams,
+            **time_queryparams,
+        }
 
         if timestamp_queryparams is not None:
             for ts_queryparam in timestamp_queryparams:
@@ -1916,81 +2260,113 @@ def create_list_of_search_requests(
                 )
                 planned_requests.append(new_request)
 
-        if complete_orbits is not None:
-            complete_orbits_chunks = split_list_into_chunks(
-                complete_orbits, MAX_NUM_ORBITS_PER_REQUEST
+        planned_requests.extend(
+            SearchRequest(
+                **baseline_queryparams,
+                orbit_number=complete_orbits_chunk_queryparam,
+            )
+            for complete_orbits_chunk_queryparam in complete_orbits_chunk_queryparams
+        )
+        planned_requests.extend(
+            SearchRequest(
+                **baseline_queryparams,
+                frame_id=frame_id_queryparam,
+                orbit_number=incomplete_orbits_chunk_queryparam,
             )
-            for complete_orbits_chunk in complete_orbits_chunks:
-                complete_orbits_chunk_queryparam = (
-                    "["
-                    + ",".join(
-                        [
-                            str(get_validated_orbit_number(o))
-                            for o in complete_orbits_chunk
-                        ]
-                    )
-                    + "]"
-                )
-                new_request = SearchRequest(
-                    **basic_product_queryparams,
-                    **geo_location_queryparams,
-                    **time_queryparams,
-                    orbit_number=complete_orbits_chunk_queryparam,
-                )
-                planned_requests.append(new_request)
-
-        if incomplete_orbits_frame_map is not None:
             for (
                 frame_id_queryparam,
-                incomplete_orbits,
-            ) in incomplete_orbits_frame_map.items():
-                incomplete_orbits_chunks = split_list_into_chunks(
-                    incomplete_orbits, MAX_NUM_ORBITS_PER_REQUEST
-                )
-                for incomplete_orbits_chunk in incomplete_orbits_chunks:
-                    incomplete_orbits_chunk_queryparam = (
-                        "["
-                        + ",".join(
-                            [
-                                str(get_validated_orbit_number(o))
-                                for o in incomplete_orbits_chunk
-                            ]
-                        )
-                        + "]"
-                    )
-                    new_request = SearchRequest(
-                        **basic_product_queryparams,
-                        **geo_location_queryparams,
-                        **time_queryparams,
-                        frame_id=frame_id_queryparam,
-                        orbit_number=incomplete_orbits_chunk_queryparam,
-                    )
-                    planned_requests.append(new_request)
+                incomplete_orbits_chunk_queryparam,
+            ) in incomplete_orbits_chunk_queryparams
+        )
 
         if (
             complete_orbits is None
             and incomplete_orbits_frame_map is None
             and (start_time_queryparam is not None and end_time_queryparam is not None)
         ):
-            if frame_ids is not None:
-                for frame_id in frame_ids:
-                    new_request = SearchRequest(
-                        **basic_product_queryparams,
-                        **geo_location_queryparams,
-                        **time_queryparams,
-                        frame_id=str(frame_id),
-                    )
-                planned_requests.append(new_request)
-            else:
-                new_request = SearchRequest(
-                    **basic_product_queryparams,
-                    **geo_location_queryparams,
-                    **time_queryparams,
+            if frame_id_queryparams is not None:
+                planned_requests.extend(
+                    SearchRequest(**baseline_queryparams, frame_id=frame_id_queryparam)
+                    for frame_id_queryparam in frame_id_queryparams
                 )
+            else:
+                new_request = SearchRequest(**baseline_queryparams)
                 planned_requests.append(new_request)
     return planned_requests
 
 
+def execute_search_request(
+    search_request: SearchRequest,
+    counter_msg: str = "",
+    session: requests.Session | None = None,
+    logger: Logger | None = None,
+) -> "pd.DataFrame | None":
+    """
+    Performs a search request in the selected collections and returns the found products.
+
+    Args:
+        search_request (SearchRequest): The search request to be performed.
+        counter_msg (str, optional): Counter displayed as prefix in log messages. Defaults to an empty string.
+        session (requests.Session | None, optional): Session whose connection pool is used for the requests. Defaults to None.
+        logger (Logger | None, optional): Logger instance for logging. Defaults to None.
+
+    Returns:
+        pd.DataFrame | None: DataFrame containing found products of the first collection with results or None if nothing was found.
+    """
+    if logger:
+        logger.info(
+            f"*{counter_msg} Search request: {search_request.low_detail_summary()}"
+        )
+        logger.debug(f" {counter_msg} {search_request}")
+    collection_identifier_list = search_request.collection_identifier_list
+    if len(collection_identifier_list) == 0:
+        if logger:
+            logger.warning(
+                f" {counter_msg} No collection was selected. Please make sure that you have added the appropriate collections for this product in the configuration file and that you are allowed to access to them."
+            )
+        return None
+
+    for collection_identifier in collection_identifier_list:
+        try:
+            url_items = get_url_of_collection_items(
+                collection_identifier, session=session, logger=logger
+            )
+        except Exception as e:
+            if logger:
+                logger.exception(e)
+            continue
+        dataframe = get_product_list_json(
+            url_items,
+            product_id_text=None,
+            sort_by_text=None,
+            num_results_text=str(int(MAX_NUM_RESULTS_PER_REQUEST)),
+            start_time_text=search_request.start_time,
+            end_time_text=search_request.end_time,
+            poi_text=None,
+            bbox_text=search_request.bbox,
+            illum_angle_text=None,
+            frame_text=search_request.frame_id,
+            orbit_number_text=search_request.orbit_number,
+            instrument_text=None,
+            productType_text=search_request.product_type,
+            productVersion_text=search_request.product_version,
+            orbitDirection_text=None,
+            radius_text=search_request.radius,
+            lat_text=search_request.lat,
+            lon_text=search_request.lon,
+            msg_prefix=f" {counter_msg} ",
+            session=session,
+            logger=logger,
+        )
+        if logger:
+            logger.info(
+                f" {counter_msg} Files found in collection '{collection_identifier}': {len(dataframe)}"
+            )
+        if len(dataframe) > 0:
+            return dataframe
+    return None
+
+
 def main(
     product_types: list[str],
     path_to_data: str | None,
@@ -2021,7 +2397,7 @@ def main(
 ):
     raw_user_inputs = locals()
 
-    time_start_script = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    time_start_script = time.monotonic()
 
     # Welcome message
     if logger:
@@ -2032,6 +2408,52 @@ def main(
         for k, v in raw_user_inputs.items():
             logger.debug(f" - {k}: {v}")
 
+    # Read credentials
+    if path_to_config is None:
+        path_to_script = os.path.abspath(__file__)
+        path_to_script_dir = os.path.dirname(path_to_script)
+        path_to_config = os.path.join(path_to_script_dir, "config.toml")
+        if logger:
+            logger.info(f"Setting path_to_config to <{path_to_config}>")
+    username = ""
+    password = ""
+    try:
+        if os.path.exists(path_to_config):
+            with open(path_to_config, "rb") as f:
+                file = tomllib.load(f)
+                username = file["OADS_credentials"]["username"]
+                password = file["OADS_credentials"]["password"]
+                selected_collections = file["OADS_credentials"]["collections"]
+
+                if (
+                    path_to_data is None
+                    and file["Local_file_system"]["data_directory"] != ""
+                ):
+                    path_to_data = file["Local_file_system"]["data_directory"]
+            if logger:
+                logger.info(f"Found config file at <{path_to_config}>")
+        else:
+            raise FileNotFoundError(
+                f"No config file found at <{path_to_config}>. Please make sure you've created one. Run 'python {os.path.basename(__file__)} -h' for help."
+            )
+    except FileNotFoundError as e:
+        if logger:
+            logger.exception(e)
+        raise
+
+    if path_to_data is None:
+        path_to_data = os.path.dirname(os.path.abspath(__file__))
+
+    try:
+        if not os.path.exists(path_to_data):
+            raise FileNotFoundError(
+                f"Given data folder does not exist: <{path_to_data}>"
+            )
+    except FileNotFoundError as e:
+        if logger:
+            logger.exception(e)
+        raise
+
     # Validate and format user inputs
     selected_index = get_validated_selected_index(download_idx, logger=logger)
     validate_combination_of_given_orbit_and_frame_range_inputs(
@@ -2100,7 +2522,8 @@ def main(
         timestamp_queryparams,
         complete_orbits,
         incomplete_orbits_frame_map,
-        frame_ids,
+        frame_id_queryparams,
+        selected_collections=frozenset(selected_collections),
     )
 
     if logger:
@@ -2108,143 +2531,78 @@ def main(
         log_heading(f"PART 1 - Search products", logger)
         console_exclusive_info()
 
-    # Read credentials
-    if path_to_config is None:
-        path_to_script = os.path.abspath(__file__)
-        path_to_script_dir = os.path.dirname(path_to_script)
-        path_to_config = os.path.join(path_to_script_dir, "config.toml")
-        if logger:
-            logger.info(f"Setting path_to_config to <{path_to_config}>")
-    username = ""
-    password = ""
-    try:
-        if os.path.exists(path_to_config):
-            with open(path_to_config, "rb") as f:
-                file = tomllib.load(f)
-                username = file["OADS_credentials"]["username"]
-                password = file["OADS_credentials"]["password"]
-                selected_collections = file["OADS_credentials"]["collections"]
-
-                if (
-                    path_to_data is None
-                    and file["Local_file_system"]["data_directory"] != ""
-                ):
-                    path_to_data = file["Local_file_system"]["data_directory"]
-            if logger:
-                logger.info(f"Found config file at <{path_to_config}>")
-        else:
-            raise FileNotFoundError(
-                f"No config file found at <{path_to_config}>. Please make sure you've created one. Run 'python {os.path.basename(__file__)} -h' for help."
-            )
-    except FileNotFoundError as e:
-        if logger:
-            logger.exception(e)
-        raise
-
-    if path_to_data is None:
-        path_to_data = os.path.dirname(os.path.abspath(__file__))
-
-    try:
-        if not os.path.exists(path_to_data):
-            raise FileNotFoundError(
-                f"Given data folder does not exist: <{path_to_data}>"
-            )
-    except FileNotFoundError as e:
-        if logger:
-            logger.exception(e)
-        raise
-
     if logger:
         console_exclusive_info()
         logger.info(f"Number of pending search requests: {len(planned_requests)}")
-    dfs = []
-    counter_request = 0
     num_planned_requests = len(planned_requests)
-    for request_ixd, search_request in enumerate(planned_requests):
-        counter_request = counter_request + 1
-        counter_msg, _ = get_counter_message(counter_request, num_planned_requests)
-
-        search_request.collection_identifier_list = [
-            c
-            for c in search_request.collection_identifier_list
-            if c in set(selected_collections)
-        ]
-        if logger:
-            logger.info(
-                f"*{counter_msg} Search request: {search_request.low_detail_summary()}"
-            )
-            logger.debug(f" {counter_msg} {search_request}")
-        collection_identifier_list = search_request.collection_identifier_list
-        if len(collection_identifier_list) == 0:
-            if logger:
-                logger.warning(
-                    f" {counter_msg} No collection was selected. Please make sure that you have added the appropriate collections for this product in the configuration file and that you are allowed to access to them."
-                )
-
-        for collection_identifier in collection_identifier_list:
-            try:
-                url_items = get_url_of_collection_items(
-                    collection_identifier, logger=logger
-                )
-            except Exception as e:
-                if logger:
-                    logger.exception(e)
-                continue
-            dataframe = get_product_list_json(
-                url_items,
-                product_id_text=None,
-                sort_by_text=None,
-                num_results_text=str(int(MAX_NUM_RESULTS_PER_REQUEST)),
-                start_time_text=search_request.start_time,
-                end_time_text=search_request.end_time,
-                poi_text=None,
-                bbox_text=search_request.bbox,
-                illum_angle_text=None,
-                frame_text=search_request.frame_id,
-                orbit_number_text=search_request.orbit_number,
-                instrument_text=None,
-                productType_text=search_request.product_type,
-                productVersion_text=search_request.product_version,
-                orbitDirection_text=None,
-                radius_text=search_request.radius,
-                lat_text=search_request.lat,
-                lon_text=search_request.lon,
-                msg_prefix=f" {counter_msg} ",
+    # Search requests (e.g. orbit chunks) are independent and are send concurrently,
+    # sharing the connections of one session
+    with (
+        create_session() as search_session,
+        ThreadPoolExecutor(max_workers=MAX_NUM_PARALLEL_SEARCH_REQUESTS) as executor,
+    ):
+        future_to_idx = {}
+        for counter_request, search_request in enumerate(planned_requests, start=1):
+            counter_msg, _ = get_counter_message(counter_request, num_planned_requests)
+            future = executor.submit(
+                execute_search_request,
+                search_request,
+                counter_msg,
+                session=search_session,
                 logger=logger,
             )
-            dataframe = drop_duplicate_files(dataframe, "id")
-            if logger:
-                logger.info(
-                    f" {counter_msg} Files found in collection '{collection_identifier}': {len(dataframe)}"
-                )
-            if len(dataframe) > 0:
-                dfs.append(dataframe)
-                break
+            future_to_idx[future] = counter_request - 1
+        # Results are collected as they arrive but kept in the order of the requests
+        results: "list[pd.DataFrame | None]" = [None] * num_planned_requests
+        try:
+            for future in as_completed(future_to_idx):
+                results[future_to_idx[future]] = future.result()
+        except BaseException:
+            # Pending requests are dropped on errors or user interruption
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        dfs = [df for df in results if df is not None]
+
+    import pandas as pd
 
     if len(dfs) > 0:
-        dataframe = pd.concat(dfs, ignore_index=True)
+        # Duplicates are dropped once for results of all requests and collections,
+        # then the index is reset so that labels match the positions in the list
+        dataframe = drop_duplicate_files(
+            pd.concat(dfs, ignore_index=True), "id"
+        ).sort_values(by="id", ignore_index=True)
     else:
         dataframe = pd.DataFrame()
 
     total_results = len(dataframe)
     if total_results > 0:
-        dataframe = drop_duplicate_files(dataframe, "id")
-        dataframe = dataframe.sort_values(by="id")
         if logger:
             console_exclusive_info()
             logger.info(f"List of files found (total number {total_results}):")
         if selected_index is not None:
-            try:
-                selected_index = dataframe.iloc[[selected_index]].index[0]
-            except IndexError:
+            # Index labels equal list positions, so negative indices can be resolved directly
+            if not -total_results <= selected_index < total_results:
                 raise InvalidInputError(
                     f"The index you selected exceeds the bounds of the found files list (1 - {total_results})"
                 )
-        for idx, file in enumerate(dataframe["id"].to_numpy()):
+            selected_index %= total_results
+        files = dataframe["id"].to_numpy()
+        idx_width = len(str(total_results))
+        # Messages of files hidden from the console are only needed for debug logs
+        if logger is None:
+            indices: Iterable[int] = ()
+        elif total_results > 41 and all(
+            h.level > logging.DEBUG for h in logger.handlers
+        ):
+            indices = chain(range(21), range(total_results - 20, total_results))
+        else:
+            indices = range(total_results)
+        for idx in indices:
+            file = files[idx]
             if logger:
-                msg = f" [{str(idx+1).rjust(len(str(total_results)))}]  {file}"
+                msg = f" [{str(idx+1).rjust(idx_width)}]  {file}"
                 if selected_index is not None and idx == selected_index:
-                    msg = f"<[{str(idx+1).rjust(len(str(total_results)))}]> {file} <-- Select file (user input: {download_idx})"
+                    msg = f"<[{str(idx+1).rjust(idx_width)}]> {file} <-- Select file (user input: {download_idx})"
                 if total_results > 41:
                     if idx == 20:
                         console_exclusive_info(
@@ -2258,7 +2616,8 @@ def main(
                         console_exclusive_info(msg)
                 logger.debug(msg)
         if is_found_files_list_to_txt:
-            dataframe["id"].to_csv("results.txt", index=False, header=False)
+            with open("results.txt", "w", encoding="utf-8") as f:
+                f.writelines(f"{file}\n" for file in dataframe["id"].tolist())
         else:
             logger.info(f"Note: To export this list use the option --export_results")
         if selected_index is not None:
@@ -2312,10 +2671,14 @@ def main(
         log_heading(f"END OF SCRIPT", logger)
         console_exclusive_info()
 
-    time_end_script = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    execution_time = int(time.monotonic() - time_start_script)
     if logger:
+        # Same format as the string representation of pandas.Timedelta
+        days, execution_time = divmod(execution_time, 86400)
+        hours, execution_time = divmod(execution_time, 3600)
+        minutes, seconds = divmod(execution_time, 60)
         logger.info(
-            f"Execution time:   {pd.Timestamp(time_end_script) - pd.Timestamp(time_start_script)}"
+            f"Execution time:   {days} days {hours:02d}:{minutes:02d}:{seconds:02d}"
         )
     size_msg = f"{total_download_size:.2f} MB"
     if total_download_size >= 1024: